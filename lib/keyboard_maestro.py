@@ -20,6 +20,7 @@ import os
 import time
 
 from .output_manager import OutputManager
+from .utils import applescript_open_command, sanitize_filename
 
 
 class KeyboardMaestroClient:
@@ -278,7 +279,7 @@ class KeyboardMaestroClient:
             }]
             
             # Generate output path
-            safe_name = colleague_name.replace(' ', '_').replace('/', '_')
+            safe_name = sanitize_filename(colleague_name)
             output_file = self.output_manager.get_colleague_folder(colleague_name)
             kmmacros_path = os.path.join(output_file, f"One-to-One - {safe_name}.kmmacros")
             
@@ -331,10 +332,30 @@ class KeyboardMaestroClient:
         Returns:
             Path to the .kmmacros file
         """
-        safe_name = colleague_name.replace(' ', '_').replace('/', '_')
+        safe_name = sanitize_filename(colleague_name)
         colleague_folder = self.output_manager.get_colleague_folder(colleague_name)
         return os.path.join(colleague_folder, f"One-to-One - {safe_name}.kmmacros")
     
+    def get_import_applescript(self, colleague_name: str) -> Optional[Tuple[str, str]]:
+        """
+        Get AppleScript that imports the macro and then opens Keyboard Maestro.
+        
+        This lets the final import step be batched with other integrations in a
+        single osascript run; import_and_open_macro does the same on its own.
+        
+        Args:
+            colleague_name: Full name of the colleague
+            
+        Returns:
+            Tuple of (import_script, open_script), or None if the macro file doesn't exist
+        """
+        kmmacros_file = self.get_macro_file_path(colleague_name)
+        if not os.path.exists(kmmacros_file):
+            self.logger.warning(f"Macro file not found: {kmmacros_file}")
+            return None
+        
+        return applescript_open_command(kmmacros_file), applescript_open_command('Keyboard Maestro', app=True)
+    
     def import_and_open_macro(self, colleague_name: str) -> bool:
         """
         Import the Keyboard Maestro macro and open it (final step).
@@ -6,12 +6,60 @@ to create hierarchical tags for one-on-one meetings.
 """
 
 import os
+import string
 import subprocess
 import logging
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from .perspective_generator import PerspectiveGenerator
 from .output_manager import OutputManager
+from .utils import applescript_open_command
+
+
+# AppleScript sources are built once at import time and only substituted per call.
+
+# Create a child tag under the parent tag identified by $tag_id.
+# Returns a status token: OK_CREATED:<id>, OK_EXISTS:<id>, ERR_NO_PARENT or ERR_<message>
+_APPLESCRIPT_CREATE_TAG = string.Template('''
+tell application "OmniFocus"
+    tell default document
+        try
+            -- Resolve parent tag by ID at any depth (OmniFocus does the lookup in-app)
+            set matchingTags to (flattened tags whose id is "$tag_id")
+            if (count of matchingTags) is 0 then
+                return "ERR_NO_PARENT"
+            end if
+            set parentTag to item 1 of matchingTags
+            
+            -- Check if child tag already exists
+            set existingTags to (tags of parentTag whose name is "$tag_name")
+            if (count of existingTags) > 0 then
+                return "OK_EXISTS:" & (id of (item 1 of existingTags) as string)
+            else
+                -- Create new child tag
+                set newTag to make new tag at parentTag with properties {name:"$tag_name"}
+                return "OK_CREATED:" & (id of newTag as string)
+            end if
+            
+        on error errorMessage
+            return "ERR_" & errorMessage
+        end try
+    end tell
+end tell
+''')
+
+# Look up a tag by name at any depth
+_APPLESCRIPT_FIND_TAG = string.Template('''
+tell application "OmniFocus"
+    tell default document
+        set matchingTags to (flattened tags whose name is "$tag_name")
+        if (count of matchingTags) is 0 then
+            return "NOT_FOUND"
+        end if
+        return id of (item 1 of matchingTags) as string
+    end tell
+end tell
+''')
 
 
 class OmniFocusClient:
@@ -38,6 +86,10 @@ class OmniFocusClient:
         self.tag_url = f"omnifocus:///tag/{self.tag_id}" if self.tag_id else ''
         self.output_manager = output_manager
         
+        # Child tag IDs reported by tag creation or found by lookup, keyed by
+        # tag name, so each tag needs at most one AppleScript round trip
+        self._child_tag_ids: Dict[str, str] = {}
+        
         self.logger = logging.getLogger(__name__)
         
         # Initialize perspective generator with output manager
@@ -148,71 +200,7 @@ class OmniFocusClient:
             self.logger.info(f"Creating OmniFocus tag '{tag_name}' under parent tag URL: {self.tag_url}")
             
             # AppleScript to create tag under specific parent using tag ID
-            applescript = f'''
-            tell application "OmniFocus"
-                tell default document
-                    set parentTag to missing value
-                    
-                    try
-                        -- Find parent tag by ID (search through all tags including children)
-                        set tagID to "{self.tag_id}"
-                        
-                        -- Search top-level tags first
-                        repeat with aTag in tags
-                            if id of aTag as string is tagID then
-                                set parentTag to aTag
-                                exit repeat
-                            end if
-                        end repeat
-                        
-                        -- If not found, search child tags
-                        if parentTag is missing value then
-                            repeat with topTag in tags
-                                repeat with childTag in tags of topTag
-                                    if id of childTag as string is tagID then
-                                        set parentTag to childTag
-                                        exit repeat
-                                    end if
-                                    -- Search grandchildren (3rd level)
-                                    repeat with grandTag in tags of childTag
-                                        if id of grandTag as string is tagID then
-                                            set parentTag to grandTag
-                                            exit repeat
-                                        end if
-                                    end repeat
-                                    if parentTag is not missing value then exit repeat
-                                end repeat
-                                if parentTag is not missing value then exit repeat
-                            end repeat
-                        end if
-                        
-                        if parentTag is missing value then
-                            return "Error: Could not find parent tag with ID: {self.tag_id}"
-                        end if
-                        
-                        -- Check if child tag already exists
-                        set childExists to false
-                        repeat with childTag in tags of parentTag
-                            if (name of childTag) as string is "{tag_name}" then
-                                set childExists to true
-                                exit repeat
-                            end if
-                        end repeat
-                        
-                        if childExists then
-                            return "Tag already exists: " & (name of parentTag) & " > {tag_name}"
-                        else
-                            -- Create new child tag
-                            make new tag at parentTag with properties {{name:"{tag_name}"}}
-                            return "Created tag: " & (name of parentTag) & " > {tag_name}"
-                        end if
-                        
-                    on error errorMessage
-                        return "AppleScript error: " & errorMessage
-                    end try
-                end tell
-            end tell
-            '''
+            applescript = _APPLESCRIPT_CREATE_TAG.substitute(tag_id=self.tag_id, tag_name=tag_name)
             
             # Execute the AppleScript
             result = subprocess.run(
@@ -223,17 +211,26 @@ class OmniFocusClient:
             )
             
             if result.returncode == 0:
-                output = result.stdout.strip()
-                self.logger.info(f"AppleScript result: {output}")
+                status = result.stdout.strip()
+                self.logger.debug(f"AppleScript status: {status}")
                 
-                if "Created tag:" in output or "Tag already exists:" in output:
-                    self.logger.info(f"Successfully handled OmniFocus tag: {tag_name}")
+                token, _, child_tag_id = status.partition(':')
+                if token in ("OK_CREATED", "OK_EXISTS"):
+                    if child_tag_id:
+                        self._child_tag_ids[tag_name] = child_tag_id
+                    if token == "OK_CREATED":
+                        self.logger.info(f"Created OmniFocus tag: {tag_name}")
+                    else:
+                        self.logger.info(f"OmniFocus tag already exists: {tag_name}")
                     return True
-                elif "Error:" in output:
-                    self.logger.error(f"AppleScript error: {output}")
+                elif status == "ERR_NO_PARENT":
+                    self.logger.error(f"Could not find parent tag with ID: {self.tag_id}")
+                    return False
+                elif status.startswith("ERR_"):
+                    self.logger.error(f"AppleScript error: {status[len('ERR_'):]}")
                     return False
                 else:
-                    self.logger.warning(f"Unexpected AppleScript output: {output}")
+                    self.logger.warning(f"Unexpected AppleScript output: {status}")
                     return False
             else:
                 self.logger.error(f"AppleScript failed: {result.stderr}")
@@ -247,6 +244,18 @@ class OmniFocusClient:
             return False
     
     
+    def get_tag_name(self, colleague_name: str) -> str:
+        """
+        Get the tag name for a colleague without querying OmniFocus.
+        
+        Args:
+            colleague_name: Full name of the colleague
+            
+        Returns:
+            Tag name for the colleague
+        """
+        return self._generate_tag_name(colleague_name)
+    
     def get_tag_info(self, colleague_name: str) -> Dict[str, str]:
         """
         Get information about the tag for a colleague, including actual tag ID if it exists.
@@ -280,37 +289,16 @@ class OmniFocusClient:
         """
         try:
             tag_name = self._generate_tag_name(colleague_name)
+            
+            cached_tag_id = self._child_tag_ids.get(tag_name)
+            if cached_tag_id:
+                self.logger.debug(f"Using cached child tag ID for '{tag_name}': {cached_tag_id}")
+                return cached_tag_id
+            
             self.logger.debug(f"Searching for child tag: {tag_name}")
             
-            # AppleScript to search for the child tag by name using nested loops
-            applescript = f'''
-            tell application "OmniFocus"
-                tell default document
-                    -- Search through all tags up to 3 levels deep
-                    repeat with level1Tag in tags
-                        if name of level1Tag is "{tag_name}" then
-                            return id of level1Tag as string
-                        end if
-                        
-                        -- Search level 2 (children of level 1)
-                        repeat with level2Tag in tags of level1Tag
-                            if name of level2Tag is "{tag_name}" then
-                                return id of level2Tag as string
-                            end if
-                            
-                            -- Search level 3 (children of level 2)
-                            repeat with level3Tag in tags of level2Tag
-                                if name of level3Tag is "{tag_name}" then
-                                    return id of level3Tag as string
-                                end if
-                            end repeat
-                        end repeat
-                    end repeat
-                    
-                    return "NOT_FOUND"
-                end tell
-            end tell
-            '''
+            # AppleScript to search for the child tag by name
+            applescript = _APPLESCRIPT_FIND_TAG.substitute(tag_name=tag_name)
             
             result = subprocess.run(
                 ['osascript', '-e', applescript],
@@ -323,6 +311,7 @@ class OmniFocusClient:
                 tag_id = result.stdout.strip()
                 if tag_id and tag_id != "NOT_FOUND":
                     self.logger.debug(f"Found child tag ID for '{tag_name}': {tag_id}")
+                    self._child_tag_ids[tag_name] = tag_id
                     return tag_id
                 else:
                     self.logger.debug(f"Child tag '{tag_name}' not found")
@@ -368,6 +357,27 @@ class OmniFocusClient:
         """
         return self.output_manager.get_perspective_folder(colleague_name)
     
+    def get_import_applescript(self, colleague_name: str) -> Optional[Tuple[str, str]]:
+        """
+        Get AppleScript that imports the perspective and then opens it.
+        
+        This lets the final import step be batched with other integrations in a
+        single osascript run; import_and_open_perspective does the same on its own.
+        
+        Args:
+            colleague_name: Full name of the colleague
+            
+        Returns:
+            Tuple of (import_script, open_script), or None if the perspective doesn't exist
+        """
+        perspective_folder = self.get_perspective_folder(colleague_name)
+        if not os.path.exists(perspective_folder):
+            self.logger.warning(f"Perspective folder not found: {perspective_folder}")
+            return None
+        
+        perspective_url = f"omnifocus:///perspective/{colleague_name}"
+        return applescript_open_command(perspective_folder), applescript_open_command(perspective_url)
+    
     def import_and_open_perspective(self, colleague_name: str) -> bool:
         """
         Import the OmniFocus perspective and open it (final step).
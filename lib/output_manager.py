@@ -7,8 +7,13 @@ all their related files (photos, perspectives, notes, etc.).
 """
 
 import os
+import re
 import logging
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Set
+
+# Anything that isn't alphanumeric, '-' or '_' (same set as str.isalnum)
+_UNSAFE_FOLDER_CHARS = re.compile(r'[^\w-]')
 
 
 class OutputManager:
@@ -25,6 +30,11 @@ class OutputManager:
         self.base_folder = os.path.expanduser(self.config.get('base_folder', '.output'))
         self.logger = logging.getLogger(__name__)
         
+        # Folders known to exist, so repeated path lookups skip the makedirs
+        # syscalls; seeded with the colleague folders already on disk
+        self._ensured: Set[str] = set()
+        self._scan_existing_folders()
+        
         self.logger.info(f"Output manager initialized: {self.base_folder}")
     
     def get_colleague_folder(self, colleague_name: str) -> str:
@@ -69,11 +79,10 @@ class OutputManager:
         Returns:
             Full path to the perspective folder
         """
-        colleague_folder = self.get_colleague_folder(colleague_name)
         safe_name = self._sanitize_folder_name(colleague_name)
-        perspective_folder = os.path.join(colleague_folder, f"{safe_name}.ofocus-perspective")
+        perspective_folder = os.path.join(self.base_folder, safe_name, f"{safe_name}.ofocus-perspective")
         
-        # Create the perspective folder
+        # Create the perspective folder (makedirs creates the colleague folder too)
         self._ensure_folder_exists(perspective_folder)
         
         return perspective_folder
@@ -104,7 +113,9 @@ class OutputManager:
         perspective_folder = self.get_perspective_folder(colleague_name)
         return os.path.join(perspective_folder, "icon.png")
     
-    def _sanitize_folder_name(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _sanitize_folder_name(name: str) -> str:
         """
         Sanitize a name for use as a folder name.
         
@@ -115,9 +126,29 @@ class OutputManager:
             Sanitized folder name
         """
         # Replace spaces and special characters with underscores
-        safe_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in name)
+        safe_name = _UNSAFE_FOLDER_CHARS.sub('_', name)
         return safe_name.strip('_')
     
+    def _scan_existing_folders(self) -> None:
+        """
+        Record existing colleague and perspective folders as already ensured.
+        
+        Scans two levels below the base folder, which covers the deepest
+        folders the path accessors create.
+        """
+        try:
+            with os.scandir(self.base_folder) as colleagues:
+                for colleague in colleagues:
+                    if not colleague.is_dir():
+                        continue
+                    self._ensured.add(colleague.path)
+                    with os.scandir(colleague.path) as children:
+                        self._ensured.update(child.path for child in children if child.is_dir())
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.debug(f"Could not scan output folder {self.base_folder}: {e}")
+    
     def _ensure_folder_exists(self, folder_path: str) -> None:
         """
         Ensure a folder exists, creating it if necessary.
@@ -125,8 +156,12 @@ class OutputManager:
         Args:
             folder_path: Path to the folder
         """
+        if folder_path in self._ensured:
+            return
+        
         try:
             os.makedirs(folder_path, exist_ok=True)
+            self._ensured.add(folder_path)
             self.logger.debug(f"Ensured folder exists: {folder_path}")
         except Exception as e:
             self.logger.error(f"Failed to create folder {folder_path}: {e}")
@@ -6,17 +6,20 @@ Based on analysis of exported perspective structure.
 """
 
 import io
+import importlib.util
 import logging
 import plistlib
 import os
-from typing import Dict, Any
+import re
+from pathlib import Path
+from typing import Dict, Any, Tuple
 from .output_manager import OutputManager
 
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# Pillow is imported lazily when an icon is created
+PIL_AVAILABLE = importlib.util.find_spec('PIL') is not None
+
+# Template placeholders, replaced in a single pass
+_PLACEHOLDER_PATTERN = re.compile(r'#(perspectiveName|personTagId)')
 
 
 class PerspectiveGenerator:
@@ -25,6 +28,9 @@ class PerspectiveGenerator:
     def __init__(self, output_manager: OutputManager):
         self.output_manager = output_manager
         self.logger = logging.getLogger(__name__)
+        
+        # Parsed templates keyed by path, with the mtime they were read at
+        self._template_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
     
     def create_colleague_perspective_plist(
         self, 
@@ -46,12 +52,10 @@ class PerspectiveGenerator:
         try:
             self.logger.info(f"Generating perspective plist for {colleague_name}")
             
-            # Read template XML and replace placeholders
-            template_xml = self._read_template_xml(template_path)
-            processed_xml = self._replace_placeholders(template_xml, colleague_name, colleague_tag_id)
-            
-            # Convert XML to plist data
-            plist_data = self._xml_to_plist_data(processed_xml)
+            # Fill placeholders in a copy of the parsed template
+            template_plist = self._load_template_plist(template_path)
+            plist_data = self._fill_placeholders(template_plist, colleague_name, colleague_tag_id)
+            self.logger.debug("Replaced placeholders: name='%s', tag_id='%s'", colleague_name, colleague_tag_id)
             
             # Get organized output path from output manager
             output_file = self.output_manager.get_perspective_plist_path(colleague_name)
@@ -71,24 +75,52 @@ class PerspectiveGenerator:
             self.logger.error(f"Failed to create perspective plist: {e}")
             raise
     
+    def _load_template_plist(self, template_path: str) -> Dict[str, Any]:
+        """
+        Load and parse the template, reusing the parsed copy while the file is unchanged.
+        
+        The returned structure is shared across calls and must not be modified.
+        """
+        try:
+            mtime = os.stat(template_path).st_mtime
+        except Exception as e:
+            raise ValueError(f"Failed to read template XML: {e}")
+        
+        cached = self._template_cache.get(template_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        template_plist = self._xml_to_plist_data(self._read_template_xml(template_path))
+        self._template_cache[template_path] = (mtime, template_plist)
+        return template_plist
+    
     def _read_template_xml(self, template_path: str) -> str:
         """Read the template XML file."""
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return Path(template_path).read_text(encoding='utf-8')
         except Exception as e:
             raise ValueError(f"Failed to read template XML: {e}")
     
-    def _replace_placeholders(self, xml_content: str, colleague_name: str, colleague_tag_id: str) -> str:
-        """Replace placeholders in XML content."""
+    def _fill_placeholders(self, value: Any, colleague_name: str, colleague_tag_id: str) -> Any:
+        """
+        Return a copy of a parsed plist value with placeholders replaced in every string.
+        
+        Containers are rebuilt rather than modified, so the cached template stays intact.
+        """
+        if isinstance(value, str):
+            return self._replace_placeholders(value, colleague_name, colleague_tag_id)
+        if isinstance(value, dict):
+            return {key: self._fill_placeholders(item, colleague_name, colleague_tag_id)
+                    for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._fill_placeholders(item, colleague_name, colleague_tag_id) for item in value]
+        return value
+    
+    def _replace_placeholders(self, text: str, colleague_name: str, colleague_tag_id: str) -> str:
+        """Replace placeholders in a template string."""
         try:
-            # Replace the placeholders
-            processed_xml = xml_content
-            processed_xml = processed_xml.replace('#perspectiveName', colleague_name)
-            processed_xml = processed_xml.replace('#personTagId', colleague_tag_id)
-            
-            self.logger.debug(f"Replaced placeholders: name='{colleague_name}', tag_id='{colleague_tag_id}'")
-            return processed_xml
+            replacements = {'perspectiveName': colleague_name, 'personTagId': colleague_tag_id}
+            return _PLACEHOLDER_PATTERN.sub(lambda match: replacements[match.group(1)], text)
             
         except Exception as e:
             raise ValueError(f"Failed to replace placeholders: {e}")
@@ -105,8 +137,8 @@ class PerspectiveGenerator:
     def _write_plist_file(self, output_path: str, data: Dict[str, Any]) -> None:
         """Write data to plist file in binary format."""
         try:
-            with open(output_path, 'wb') as f:
-                plistlib.dump(data, f, fmt=plistlib.FMT_BINARY)
+            # Serialize in memory and write the whole file with a single call
+            Path(output_path).write_bytes(plistlib.dumps(data, fmt=plistlib.FMT_BINARY))
         except Exception as e:
             raise ValueError(f"Failed to write plist file: {e}")
     
@@ -131,6 +163,8 @@ class PerspectiveGenerator:
                 self.logger.warning(f"Profile photo not found at {photo_path} - skipping icon creation")
                 return
             
+            from PIL import Image
+            
             # Convert and save as PNG
             self.logger.debug(f"Creating perspective icon from {photo_path}")
             with Image.open(photo_path) as img:
@@ -5,15 +5,24 @@ This module handles the downloading, storage, and management of profile photos
 from Slack.
 """
 
+import os
 import requests
 import logging
+import threading
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from .slack import SlackClient
 from .output_manager import OutputManager
 from .utils import get_file_size
 
 
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+MAX_DOWNLOAD_WORKERS = 8
+IMAGE_TAIL_BYTES = 1024
+
+
 class PhotoManager:
     """
     Client for managing profile photo downloads and storage.
@@ -38,22 +47,41 @@ class PhotoManager:
         self.slack_config = config.get('slack', {})
         self.photo_size = self.slack_config.get('photo_size', '512')
         
+        # Shared session so downloads reuse HTTPS connections (also across download_many workers)
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=MAX_DOWNLOAD_WORKERS))
+        self.session.headers['User-Agent'] = 'one-on-one-setup'
+        
         self.logger = logging.getLogger(__name__)
         self.logger.info("Photo manager initialized with organized output structure")
     
-    def download_from_slack(self, slack_client: SlackClient, name: str, slack_handle: str) -> bool:
+    def download_from_slack(self, slack_client: SlackClient, name: str, slack_handle: str, force: bool = False) -> bool:
         """
         Download a colleague's profile photo from Slack.
         
+        An existing complete photo is kept as-is unless force is set. Photos
+        are only ever moved into place after a complete download; the image
+        check also catches truncated files left by older versions.
+        
         Args:
             slack_client: Initialized Slack client
             name: Colleague's full name
             slack_handle: Slack username (without @)
+            force: If True, download even if the photo already exists
             
         Returns:
             True if photo was downloaded successfully, False otherwise
         """
         try:
+            # Get organized save path from output manager
+            save_path = Path(self.output_manager.get_photo_path(name))
+            
+            if not force and get_file_size(str(save_path)) > 0:
+                if self._is_complete_image(save_path):
+                    self.logger.info(f"Profile photo for {name} already exists, skipping download: {save_path}")
+                    return True
+                self.logger.warning(f"Existing profile photo for {name} is incomplete, downloading again: {save_path}")
+            
             self.logger.info(f"Downloading profile photo for {name} (@{slack_handle})")
             
             # Get user info from Slack
@@ -68,9 +96,6 @@ class PhotoManager:
                 self.logger.error(f"Could not get photo URL for @{slack_handle}")
                 return False
             
-            # Get organized save path from output manager
-            save_path = Path(self.output_manager.get_photo_path(name))
-            
             # Download the photo
             success = self.download_photo(photo_url, save_path)
             
@@ -84,6 +109,54 @@ class PhotoManager:
             self.logger.error(f"Unexpected error downloading photo for {name}: {e}")
             return False
     
+    @staticmethod
+    def _is_complete_image(path: Path) -> bool:
+        """
+        Check that a JPEG or PNG file has its end marker.
+        
+        Args:
+            path: Path of the image file
+            
+        Returns:
+            True if the file looks complete (or is another format), False if it is truncated
+        """
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(8)
+                f.seek(0, os.SEEK_END)
+                f.seek(max(f.tell() - IMAGE_TAIL_BYTES, 0))
+                tail = f.read()
+        except OSError:
+            return False
+        
+        if header.startswith(b'\xff\xd8'):
+            return b'\xff\xd9' in tail
+        if header.startswith(b'\x89PNG\r\n\x1a\n'):
+            return b'IEND' in tail
+        return True
+    
+    def download_many(self, slack_client: SlackClient, colleagues: List[Tuple[str, str]]) -> Dict[str, bool]:
+        """
+        Download profile photos for several colleagues concurrently.
+        
+        Args:
+            slack_client: Initialized Slack client
+            colleagues: List of (name, slack_handle) pairs
+            
+        Returns:
+            Dictionary mapping each colleague name to its download success
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(self.download_from_slack, slack_client, name, slack_handle): name
+                for name, slack_handle in colleagues
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+    
     def download_photo(self, photo_url: str, save_path: Path) -> bool:
         """
         Download a photo from a URL and save it to disk.
@@ -97,25 +170,48 @@ class PhotoManager:
         """
         try:
             self.logger.info("Downloading photo from URL")
-            self.logger.debug(f"URL: {photo_url}")
-            self.logger.debug(f"Save path: {save_path}")
-            
-            # Download with requests
-            response = requests.get(photo_url, timeout=30)
-            response.raise_for_status()
-            
-            # Save to file
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
+            self.logger.debug("URL: %s", photo_url)
+            self.logger.debug("Save path: %s", save_path)
             
-            # Verify the file was created and has content
-            file_size = get_file_size(str(save_path))
-            if file_size == 0:
-                self.logger.error("Downloaded file is empty")
-                return False
+            # Stream into a temporary file next to the photo; only a complete download replaces it
+            tmp_path = save_path.with_name(f".{save_path.name}.{os.getpid()}-{threading.get_ident()}.part")
+            try:
+                with open(tmp_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f, \
+                        self.session.get(photo_url, stream=True, timeout=30) as response:
+                    response.raise_for_status()
+                    
+                    # Count bytes as they are written so no stat is needed afterwards
+                    file_size = 0
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        file_size += len(chunk)
+                    
+                    # Content-Length is only comparable when the body was not transfer-encoded
+                    expected_size = None
+                    if 'Content-Encoding' not in response.headers:
+                        expected_size = response.headers.get('Content-Length')
+                
+                # Verify the download had content
+                if file_size == 0:
+                    self.logger.error("Downloaded file is empty")
+                    return False
+                
+                # Verify the download was complete
+                if expected_size is not None and int(expected_size) != file_size:
+                    self.logger.error(f"Incomplete download: expected {expected_size} bytes, received {file_size}")
+                    return False
+                
+                os.replace(tmp_path, save_path)
+            finally:
+                # No-op after a successful replace; otherwise drops the partial download
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
             
             self.logger.info(f"Successfully saved photo to: {save_path}")
-            self.logger.debug(f"File size: {file_size:,} bytes")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"File size: {file_size:,} bytes")
             
             return True
             
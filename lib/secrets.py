@@ -7,6 +7,7 @@ without the caller knowing which secret backend sits behind it.
 
 import subprocess
 import logging
+from typing import Dict, List
 
 
 class SecretsClient:
@@ -14,6 +15,9 @@ class SecretsClient:
 
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Resolved secrets keyed by reference, so repeated lookups in one run
+        # don't spawn ff-secrets again
+        self._cache: Dict[str, str] = {}
 
     def resolve(self, ref: str) -> str:
         """
@@ -28,12 +32,52 @@ class SecretsClient:
         Raises:
             RuntimeError: If resolution fails or yields an empty value
         """
+        cached = self._cache.get(ref)
+        if cached is not None:
+            return cached
+
+        secret = self._inject(ref).strip()
+        if not secret:
+            raise RuntimeError("Resolved empty secret via ff-secrets")
+
+        self._cache[ref] = secret
+        return secret
+
+    def resolve_many(self, refs: List[str]) -> Dict[str, str]:
+        """
+        Resolve several secret references with a single ff-secrets call.
+
+        Args:
+            refs: Opaque secret references to resolve
+
+        Returns:
+            Dictionary mapping each reference to its secret value
+
+        Raises:
+            RuntimeError: If resolution fails or any value is empty
+        """
+        missing = [ref for ref in dict.fromkeys(refs) if ref not in self._cache]
+        if missing:
+            # One reference per line; ff-secrets substitutes each in place
+            values = self._inject("\n".join(missing)).rstrip("\n").split("\n")
+            if len(values) != len(missing):
+                raise RuntimeError("Unexpected ff-secrets output while resolving multiple secrets")
+
+            for ref, value in zip(missing, values):
+                value = value.strip()
+                if not value:
+                    raise RuntimeError("Resolved empty secret via ff-secrets")
+                self._cache[ref] = value
+
+        return {ref: self._cache[ref] for ref in refs}
+
+    def _inject(self, template: str) -> str:
+        """Run ff-secrets inject over a template and return its raw output."""
         try:
             result = subprocess.run(
                 ["ff-secrets", "inject"],
-                input=ref,
+                input=template.encode("utf-8"),
                 capture_output=True,
-                text=True,
                 timeout=30,
             )
         except subprocess.TimeoutExpired:
@@ -42,10 +86,8 @@ class SecretsClient:
             raise RuntimeError("ff-secrets not found in PATH")
 
         if result.returncode != 0:
-            error_msg = result.stderr.strip() if result.stderr else "Unknown error"
+            error_msg = result.stderr.decode("utf-8", "replace").strip() if result.stderr else "Unknown error"
             raise RuntimeError(f"Failed to resolve secret via ff-secrets: {error_msg}")
 
-        secret = result.stdout.strip()
-        if not secret:
-            raise RuntimeError("Resolved empty secret via ff-secrets")
-        return secret
+        # Only stdout is decoded on the success path; stderr stays raw bytes
+        return result.stdout.decode("utf-8")
@@ -5,20 +5,37 @@ This module provides integration with the Slack API for retrieving user
 information and profile photos.
 """
 
+import json
 import logging
-from typing import Dict, Any, Optional
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
 from .secrets import SecretsClient
 
 
+USERS_PAGE_LIMIT = 1000
+MAX_USER_PAGES = 5  # Limit to avoid excessive API calls
+USER_CACHE_TTL = 600  # Seconds before cached user pages are refetched
+CACHE_DIR = os.path.expanduser('~/.cache/one-on-one')
+USER_LIST_CACHE_TTL = 86400  # Seconds a saved users.list snapshot stays valid
+FALLBACK_PHOTO_KEYS = ('image_512', 'image_192', 'image_72', 'image_original')
+SAVED_PROFILE_KEYS = ('display_name', 'real_name_normalized', 'real_name', 'is_custom_image')
+
+
 class SlackClient:
     """
     Client for integrating with Slack API.
     
     This class handles:
     - User lookup by handle/username with pagination support
+    - Caching fetched user pages across lookups in a handle index
+    - Remembering handle -> user ID between runs for direct users.info lookups (per workspace)
+    - Saving fetched users.list pages to disk for later runs (per workspace)
     - Profile photo URL retrieval
     - Slack API error handling
     """
@@ -32,6 +49,22 @@ class SlackClient:
         """
         self.client = WebClient(token=token)
         self.logger = logging.getLogger(__name__)
+        
+        # Users fetched so far; further pages are only requested on a miss
+        self._members: List[Dict[str, Any]] = []
+        self._user_index: Dict[str, Dict[str, Any]] = {}
+        self._next_cursor: Optional[str] = None
+        self._pages_fetched = 0
+        self._members_fetched_at = 0.0
+        # Handle -> user ID map persisted across runs (loaded on first lookup)
+        self._user_ids: Optional[Dict[str, str]] = None
+        # Saved users.list snapshot: checked once per client, refetched on a miss
+        self._team_id: Optional[str] = None
+        self._disk_cache_checked = False
+        self._members_from_disk = False
+        # Guards the user cache when lookups run from several threads
+        self._user_lock = threading.Lock()
+        
         self.logger.info("Initialized Slack client")
     
     @classmethod
@@ -63,6 +96,19 @@ class SlackClient:
 
         return cls(token)
     
+    def warm_up(self) -> None:
+        """
+        Make a first Slack API call ahead of the first lookup.
+        
+        This also identifies the workspace, which the users.list snapshot needs.
+        Errors are only logged; the first real request reports them.
+        """
+        try:
+            self._get_team_id()
+            self.logger.debug("Slack client warmed up")
+        except Exception as e:
+            self.logger.debug(f"Slack warm-up failed: {e}")
+    
     def get_photo_url(self, user_info: Dict[str, Any], size: str = "512") -> Optional[str]:
         """
         Extract profile photo URL from user information.
@@ -77,22 +123,16 @@ class SlackClient:
         try:
             profile = user_info.get('profile', {})
             
-            # Try to get the requested size
-            photo_key = f"image_{size}"
-            photo_url = profile.get(photo_key)
-            
-            if not photo_url:
-                # Fallback to other sizes if requested size not available
-                fallback_sizes = ['image_512', 'image_192', 'image_72', 'image_original']
-                for fallback_key in fallback_sizes:
-                    photo_url = profile.get(fallback_key)
-                    if photo_url:
-                        self.logger.debug(f"Using fallback photo size: {fallback_key}")
-                        break
+            # Requested size first, then the fallback sizes
+            photo_url = None
+            for photo_key in self._photo_keys(size):
+                photo_url = profile.get(photo_key)
+                if photo_url:
+                    break
             
             if photo_url:
                 is_custom = profile.get('is_custom_image', False)
-                self.logger.debug(f"Photo URL found (custom: {is_custom}): {photo_url}")
+                self.logger.debug("Photo URL found (%s, custom: %s): %s", photo_key, is_custom, photo_url)
                 return photo_url
             else:
                 self.logger.warning("No profile photo URL found in user info")
@@ -102,10 +142,31 @@ class SlackClient:
             self.logger.error(f"Unexpected error getting photo URL: {e}")
             return None
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _photo_keys(size: str) -> Tuple[str, ...]:
+        """
+        Get the profile keys to try for a photo size, in order of preference.
+        
+        Args:
+            size: Requested photo size
+            
+        Returns:
+            The requested size's key followed by the remaining fallback keys
+        """
+        requested_key = f"image_{size}"
+        return (requested_key,) + tuple(key for key in FALLBACK_PHOTO_KEYS if key != requested_key)
+    
     def get_user_info(self, slack_handle: str) -> Optional[Dict[str, Any]]:
         """
         Get user information from Slack with pagination support.
         
+        Pages already fetched by earlier lookups (or saved to disk by a recent
+        run) are searched first. Otherwise a user ID remembered from a previous
+        run is fetched directly with users.info, an email address is resolved
+        with users.lookupByEmail, and only then are more users.list pages
+        requested.
+        
         Args:
             slack_handle: Slack username (without @)
             
@@ -113,48 +174,44 @@ class SlackClient:
             User information dictionary, or None if user not found
         """
         try:
-            # Search through paginated results to find user
-            cursor = None
-            users_searched = 0
-            max_pages = 5  # Limit to avoid excessive API calls
-            
-            for page in range(1, max_pages + 1):
-                # Get the current page of users
-                if cursor:
-                    result = self.client.users_list(cursor=cursor, limit=1000)
-                else:
-                    result = self.client.users_list(limit=1000)
+            with self._user_lock:
+                if time.monotonic() - self._members_fetched_at > USER_CACHE_TTL:
+                    self._reset_user_cache()
                 
-                users_searched += len(result['members'])
-                self.logger.debug(f"Page {page}: Searching through {len(result['members'])} users (total: {users_searched}) for @{slack_handle}")
+                handle_key = slack_handle.lower()
+                user = self._user_index.get(handle_key)
                 
-                # Search through users on this page
-                for user in result['members']:
-                    profile = user.get('profile', {})
-                    name = user.get('name', '')
-                    display_name = profile.get('display_name', '')
-                    real_name_normalized = profile.get('real_name_normalized', '')
-                    
-                    # More comprehensive matching - handle both username and display name (handle)
-                    if (name == slack_handle or 
-                        display_name == slack_handle or
-                        real_name_normalized.lower() == slack_handle.lower() or
-                        name.lower() == slack_handle.lower() or
-                        display_name.lower() == slack_handle.lower()):
-                        
-                        self.logger.info(f"Found user @{slack_handle}: {profile.get('real_name', 'Unknown')} (found on page {page})")
-                        self.logger.debug(f"  Matched on field: name={name}, display={display_name}")
-                        return user
+                if user is None and not self._disk_cache_checked:
+                    self._disk_cache_checked = True
+                    if self._load_saved_members():
+                        user = self._user_index.get(handle_key)
                 
-                # Check if there's a next page
-                if 'response_metadata' in result and result['response_metadata'].get('next_cursor'):
-                    cursor = result['response_metadata']['next_cursor']
-                    self.logger.debug(f"Moving to page {page + 1} with cursor: {cursor[:20]}...")
-                else:
-                    self.logger.debug(f"No more pages after page {page}")
-                    break  # No more pages
+                if user is None:
+                    user = self._lookup_known_user(handle_key)
+                
+                if user is None and '@' in slack_handle:
+                    user = self._lookup_user_by_email(slack_handle)
+                
+                # A saved snapshot may be missing new users; page from the start again
+                if user is None and self._members_from_disk:
+                    self._reset_user_cache()
+                
+                pages_before = self._pages_fetched
+                while user is None and self._has_more_user_pages():
+                    self._fetch_user_page(slack_handle)
+                    user = self._user_index.get(handle_key)
+                
+                if self._pages_fetched > pages_before:
+                    self._save_members()
+                
+                if user:
+                    self._remember_user_id(handle_key, user)
+            
+            if user:
+                self.logger.info(f"Found user @{slack_handle}: {user.get('profile', {}).get('real_name', 'Unknown')}")
+                return user
             
-            self.logger.warning(f"User @{slack_handle} not found in Slack workspace (searched {users_searched} users across {page} pages)")
+            self.logger.warning(f"User @{slack_handle} not found in Slack workspace (searched {len(self._members)} users across {self._pages_fetched} pages)")
             return None
             
         except SlackApiError as e:
@@ -162,4 +219,263 @@ class SlackClient:
             return None
         except Exception as e:
             self.logger.error(f"Unexpected error looking up user: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    def _lookup_known_user(self, handle_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a user directly by the ID remembered for a handle.
+        
+        Args:
+            handle_key: Lowercase Slack handle or email address
+            
+        Returns:
+            User information dictionary if the remembered user still matches the handle, None otherwise
+        """
+        user_id = self._get_user_ids().get(handle_key)
+        if not user_id:
+            return None
+        
+        try:
+            user = self.client.users_info(user=user_id)['user']
+        except SlackApiError as e:
+            self.logger.debug(f"Remembered user ID {user_id} for @{handle_key} failed: {e.response['error']}")
+            return None
+        
+        # Only trust the remembered ID if the user still answers to this handle (or email)
+        self._index_members([user])
+        if '@' in handle_key and user.get('profile', {}).get('email', '').lower() == handle_key:
+            self._user_index[handle_key] = user
+        elif self._user_index.get(handle_key) is not user:
+            self.logger.debug(f"Remembered user ID {user_id} no longer matches @{handle_key}")
+            return None
+        
+        self.logger.debug("Resolved @%s via users.info (%s)", handle_key, user_id)
+        return user
+    
+    def _lookup_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a user by email address with users.lookupByEmail.
+        
+        Args:
+            email: Email address given in place of a handle
+            
+        Returns:
+            User information dictionary, or None if the lookup failed
+        """
+        try:
+            user = self.client.users_lookupByEmail(email=email)['user']
+        except SlackApiError as e:
+            self.logger.debug(f"users.lookupByEmail failed for {email}: {e.response['error']}")
+            return None
+        
+        self._user_index[email.lower()] = user
+        return user
+    
+    def _get_user_ids(self) -> Dict[str, str]:
+        """Return the handle -> user ID map, loading it from disk on first use."""
+        if self._user_ids is None:
+            try:
+                with open(self._user_ids_cache_file(), 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                # A map of the wrong shape is ignored and overwritten by the next lookup
+                if isinstance(saved, dict):
+                    self._user_ids = {handle: user_id for handle, user_id in saved.items()
+                                      if isinstance(user_id, str)}
+                else:
+                    self._user_ids = {}
+            except SlackApiError as e:
+                self.logger.debug(f"Could not identify Slack workspace for user ID cache: {e.response['error']}")
+                self._user_ids = {}
+            except (OSError, ValueError):
+                self._user_ids = {}
+        return self._user_ids
+    
+    def _remember_user_id(self, handle_key: str, user: Dict[str, Any]) -> None:
+        """
+        Persist the user ID for a handle so later runs can use users.info.
+        
+        Args:
+            handle_key: Lowercase Slack handle
+            user: User information dictionary
+        """
+        user_ids = self._get_user_ids()
+        user_id = user.get('id')
+        if not user_id or user_ids.get(handle_key) == user_id:
+            return
+        
+        user_ids[handle_key] = user_id
+        try:
+            cache_file = self._user_ids_cache_file()
+        except SlackApiError as e:
+            self.logger.debug(f"Could not identify Slack workspace for user ID cache: {e.response['error']}")
+            return
+        
+        self._write_cache_file(cache_file, user_ids)
+    
+    def _get_team_id(self) -> str:
+        """Return the workspace team ID from auth.test, fetched once per client."""
+        if self._team_id is None:
+            self._team_id = self.client.auth_test()['team_id']
+        return self._team_id
+    
+    def _user_ids_cache_file(self) -> str:
+        """Get the handle -> user ID map path for the current workspace."""
+        return os.path.join(CACHE_DIR, f"slack_user_ids_{self._get_team_id()}.json")
+    
+    def _members_cache_file(self) -> str:
+        """Get the users.list snapshot path for the current workspace."""
+        return os.path.join(CACHE_DIR, f"slack_users_{self._get_team_id()}.json")
+    
+    def _load_saved_members(self) -> bool:
+        """
+        Load a recent users.list snapshot saved by an earlier run.
+        
+        Returns:
+            True if a snapshot younger than USER_LIST_CACHE_TTL was loaded, False otherwise
+        """
+        try:
+            cache_file = self._members_cache_file()
+            if time.time() - os.path.getmtime(cache_file) > USER_LIST_CACHE_TTL:
+                return False
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except SlackApiError as e:
+            self.logger.debug(f"Could not identify Slack workspace for user cache: {e.response['error']}")
+            return False
+        except (OSError, ValueError):
+            return False
+        
+        # A snapshot of the wrong shape is ignored; paging rewrites it
+        if not (isinstance(saved, dict)
+                and isinstance(saved.get('members'), list)
+                and isinstance(saved.get('pages'), int)
+                and all(isinstance(user, dict) for user in saved['members'])):
+            self.logger.debug(f"Ignoring malformed Slack user cache {cache_file}")
+            return False
+        
+        self._members = saved['members']
+        self._user_index = {}
+        self._index_members(self._members)
+        self._next_cursor = None
+        self._pages_fetched = saved['pages']
+        self._members_fetched_at = time.monotonic()
+        self._members_from_disk = True
+        self.logger.debug(f"Loaded {len(self._members)} Slack users from {cache_file}")
+        return True
+    
+    def _save_members(self) -> None:
+        """Save the users fetched so far for later runs."""
+        try:
+            cache_file = self._members_cache_file()
+        except SlackApiError as e:
+            self.logger.debug(f"Could not identify Slack workspace for user cache: {e.response['error']}")
+            return
+        
+        members = [self._saved_member_fields(user) for user in self._members]
+        self._write_cache_file(cache_file, {'members': members, 'pages': self._pages_fetched})
+    
+    @staticmethod
+    def _saved_member_fields(user: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reduce a user to the fields the handle index and photo lookup need.
+        
+        Emails, phone numbers, titles etc. are never written to disk.
+        
+        Args:
+            user: Slack user dictionary from users.list
+            
+        Returns:
+            User dictionary with only id, name and the needed profile fields
+        """
+        profile = user.get('profile', {})
+        return {
+            'id': user.get('id'),
+            'name': user.get('name'),
+            'profile': {
+                key: value for key, value in profile.items()
+                if key in SAVED_PROFILE_KEYS or key.startswith('image_')
+            },
+        }
+    
+    def _write_cache_file(self, path: str, data: Any) -> None:
+        """
+        Atomically write JSON data to a cache file readable only by the current user.
+        
+        Args:
+            path: Destination file path
+            data: JSON-serializable data
+        """
+        try:
+            os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+            os.chmod(CACHE_DIR, 0o700)
+            tmp_path = f"{path}.tmp"
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            # O_CREAT's mode only applies to new files; tighten a leftover temp file too
+            os.fchmod(fd, 0o600)
+            with open(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug(f"Could not save Slack cache file {path}: {e}")
+    
+    def _reset_user_cache(self) -> None:
+        """Drop cached user pages so the next lookup starts from the first page."""
+        self._members = []
+        self._user_index = {}
+        self._next_cursor = None
+        self._pages_fetched = 0
+        self._members_fetched_at = time.monotonic()
+        self._members_from_disk = False
+    
+    def _has_more_user_pages(self) -> bool:
+        """Check whether another users.list page can be fetched."""
+        if self._pages_fetched == 0:
+            return True
+        return bool(self._next_cursor) and self._pages_fetched < MAX_USER_PAGES
+    
+    def _fetch_user_page(self, slack_handle: str) -> None:
+        """
+        Fetch the next users.list page and add it to the cache.
+        
+        Args:
+            slack_handle: Handle being looked up (for logging)
+        """
+        if self._next_cursor:
+            result = self.client.users_list(cursor=self._next_cursor, limit=USERS_PAGE_LIMIT)
+        else:
+            result = self.client.users_list(limit=USERS_PAGE_LIMIT)
+        
+        members = result['members']
+        self._members.extend(members)
+        self._index_members(members)
+        self._pages_fetched += 1
+        page = self._pages_fetched
+        self.logger.debug("Page %d: Searching through %d users (total: %d) for @%s",
+                          page, len(members), len(self._members), slack_handle)
+        
+        # Check if there's a next page
+        if 'response_metadata' in result and result['response_metadata'].get('next_cursor'):
+            self._next_cursor = result['response_metadata']['next_cursor']
+            self.logger.debug("Moving to page %d with cursor: %.20s...", page + 1, self._next_cursor)
+        else:
+            self._next_cursor = None
+            self.logger.debug("No more pages after page %d", page)
+    
+    def _index_members(self, members: List[Dict[str, Any]]) -> None:
+        """
+        Add members to the handle index.
+        
+        Each user is keyed by lowercase username, display name and normalized
+        real name. Earlier users keep a key when later ones share it, matching
+        the order of a linear search through the pages.
+        
+        Args:
+            members: Slack user dictionaries to index
+        """
+        for user in members:
+            profile = user.get('profile', {})
+            for key in (user.get('name', ''),
+                        profile.get('display_name', ''),
+                        profile.get('real_name_normalized', '')):
+                if key:
+                    self._user_index.setdefault(key.lower(), user)
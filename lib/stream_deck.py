@@ -23,18 +23,31 @@ Key Features:
 - Double-click import workflow for user convenience
 """
 
+import io
 import json
 import logging
 import os
+import pickle
 import subprocess
 import time
-import uuid
 import zipfile
-import tempfile
-import shutil
-from typing import Dict, Any, Optional, Tuple
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple
 from lib.output_manager import OutputManager
+from lib.utils import applescript_open_command, sanitize_filename
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_manifest(manifest: Dict[str, Any]) -> bytes:
+    """Serialize a manifest to compact JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(manifest)
+    return json.dumps(manifest, separators=(',', ':')).encode('utf-8')
 
 
 class StreamDeckClient:
@@ -70,6 +83,9 @@ class StreamDeckClient:
         if not os.path.isfile(self.template_path):
             raise FileNotFoundError(f"Stream Deck template file not found at: {self.template_path}")
         
+        # Parse the template once; each colleague works on a copy of it
+        self._template_cache = self._extract_template()
+        
         self.logger.info(f"Stream Deck client initialized with template: {os.path.basename(self.template_path)}")
     
     def create_colleague_action(self, colleague_name: str, km_macro_uuid: str) -> bool:
@@ -86,34 +102,31 @@ class StreamDeckClient:
         try:
             self.logger.info(f"Creating Stream Deck action for {colleague_name}")
             
-            # Create temporary directory for processing
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Step 1: Extract template action
-                template_data = self._extract_template(temp_dir)
-                if not template_data:
-                    return False
-                
-                # Step 2: Modify action configuration
-                modified_data = self._modify_action_config(
-                    template_data, colleague_name, km_macro_uuid, temp_dir
-                )
-                if not modified_data:
-                    return False
-                
-                # Step 3: Create colleague-specific icon
-                icon_path = self._create_colleague_icon(colleague_name, temp_dir)
-                if not icon_path:
-                    return False
-                
-                # Step 4: Update image references
-                self._update_image_references(modified_data, icon_path, temp_dir)
-                
-                # Step 5: Create final .streamDeckAction file
-                action_file = self._create_action_file(modified_data, colleague_name, temp_dir)
-                if not action_file:
-                    return False
-                
-                self._show_import_instructions(action_file, colleague_name)
+            # Step 1: Copy the parsed template action
+            template_data = self._copy_template()
+            if not template_data:
+                return False
+            
+            # Step 2: Modify action configuration
+            modified = self._modify_action_config(template_data, colleague_name, km_macro_uuid)
+            if not modified:
+                return False
+            modified_data, image_states = modified
+            
+            # Step 3: Create colleague-specific icon
+            icon_bytes = self._create_colleague_icon(colleague_name)
+            if not icon_bytes:
+                return False
+            
+            # Step 4: Update image references
+            self._update_image_references(modified_data, image_states, icon_bytes)
+            
+            # Step 5: Create final .streamDeckAction file
+            action_file = self._create_action_file(modified_data, colleague_name)
+            if not action_file:
+                return False
+            
+            self._show_import_instructions(action_file, colleague_name)
             
             self.logger.info(f"✅ Created Stream Deck action: One-to-One - {colleague_name}")
             return True
@@ -122,85 +135,130 @@ class StreamDeckClient:
             self.logger.error(f"Failed to create Stream Deck action for {colleague_name}: {e}")
             return False
     
-    def _extract_template(self, temp_dir: str) -> Optional[Dict[str, Any]]:
+    def create_colleague_actions(self, colleagues: List[Tuple[str, str]]) -> Dict[str, bool]:
         """
-        Extract and parse the template .streamDeckAction file.
+        Create Stream Deck actions for several colleagues concurrently.
         
         Args:
-            temp_dir: Temporary directory for extraction
+            colleagues: List of (colleague_name, km_macro_uuid) pairs
             
         Returns:
-            Dictionary containing the extracted template data structure, or None if failed
+            Dictionary mapping each colleague name to whether its action was created
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(self.create_colleague_action, name, km_macro_uuid): name
+                for name, km_macro_uuid in colleagues
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        return results
+    
+    def _extract_template(self) -> Optional[Dict[str, Any]]:
+        """
+        Read and parse the template .streamDeckAction file in memory.
+        
+        Returns:
+            Dictionary containing the template data structure, or None if failed
         """
         try:
             self.logger.debug("Extracting template Stream Deck action")
             
-            # Extract the ZIP file
-            template_extract_dir = os.path.join(temp_dir, "template")
+            # Read all file members of the ZIP, keyed by archive path
             with zipfile.ZipFile(self.template_path, 'r') as zip_ref:
-                zip_ref.extractall(template_extract_dir)
+                member_bytes = {
+                    info.filename: zip_ref.read(info)
+                    for info in zip_ref.infolist()
+                    if not info.is_dir()
+                }
             
             # Find the .sdProfile directory
-            profile_dirs = [d for d in os.listdir(template_extract_dir) if d.endswith('.sdProfile')]
-            if not profile_dirs:
+            top_level = {name.partition('/')[0] for name in member_bytes}
+            profile_names = sorted(name for name in top_level if name.endswith('.sdProfile'))
+            if not profile_names:
                 self.logger.error("No .sdProfile directory found in template")
                 return None
             
-            profile_dir = os.path.join(template_extract_dir, profile_dirs[0])
+            profile_name = profile_names[0]
             
             # Read main manifest
-            main_manifest_path = os.path.join(profile_dir, 'manifest.json')
-            with open(main_manifest_path, 'r', encoding='utf-8') as f:
-                main_manifest = json.load(f)
+            main_manifest = json.loads(member_bytes[f"{profile_name}/manifest.json"])
             
             # Find profiles with actions
-            profiles_dir = os.path.join(profile_dir, 'Profiles')
+            profiles_prefix = f"{profile_name}/Profiles/"
             action_profiles = []
             
-            if os.path.exists(profiles_dir):
-                for profile_uuid in os.listdir(profiles_dir):
-                    profile_path = os.path.join(profiles_dir, profile_uuid)
-                    if not os.path.isdir(profile_path):
-                        continue
-                    
-                    manifest_path = os.path.join(profile_path, 'manifest.json')
-                    if os.path.exists(manifest_path):
-                        with open(manifest_path, 'r', encoding='utf-8') as f:
-                            profile_manifest = json.load(f)
-                        
-                        # Check if this profile has actions
-                        for controller in profile_manifest.get('Controllers', []):
-                            if controller.get('Actions'):
-                                action_profiles.append({
-                                    'uuid': profile_uuid,
-                                    'path': profile_path,
-                                    'manifest': profile_manifest
-                                })
-                                break
+            for arcname, data in member_bytes.items():
+                if not arcname.startswith(profiles_prefix):
+                    continue
+                
+                profile_uuid, _, member = arcname[len(profiles_prefix):].partition('/')
+                if member != 'manifest.json':
+                    continue
+                
+                profile_manifest = json.loads(data)
+                
+                # Check if this profile has actions
+                for controller in profile_manifest.get('Controllers', []):
+                    if controller.get('Actions'):
+                        action_profiles.append({
+                            'uuid': profile_uuid,
+                            'arc_prefix': f"{profiles_prefix}{profile_uuid}",
+                            'manifest': profile_manifest
+                        })
+                        break
             
             if not action_profiles:
                 self.logger.error("No profiles with actions found in template")
                 return None
             
             return {
-                'extract_dir': template_extract_dir,
-                'profile_dir': profile_dir,
-                'profile_name': profile_dirs[0],
+                'profile_name': profile_name,
                 'main_manifest': main_manifest,
-                'action_profiles': action_profiles
+                'action_profiles': action_profiles,
+                'member_bytes': member_bytes
             }
             
         except Exception as e:
             self.logger.error(f"Failed to extract template: {e}")
             return None
     
+    def _copy_template(self) -> Optional[Dict[str, Any]]:
+        """
+        Copy the parsed template so it can be modified for one colleague.
+        
+        Only the action profile manifests and the member dictionary are copied;
+        the main manifest and the member bytes are never modified and stay shared.
+        
+        Returns:
+            Dictionary containing a copy of the template data, or None if the template could not be parsed
+        """
+        if not self._template_cache:
+            return None
+        
+        return {
+            'profile_name': self._template_cache['profile_name'],
+            'main_manifest': self._template_cache['main_manifest'],
+            'action_profiles': [
+                {
+                    'uuid': profile['uuid'],
+                    'arc_prefix': profile['arc_prefix'],
+                    # Pickle round-trip: a faster deep copy for plain JSON data
+                    'manifest': pickle.loads(pickle.dumps(profile['manifest'], pickle.HIGHEST_PROTOCOL))
+                }
+                for profile in self._template_cache['action_profiles']
+            ],
+            'member_bytes': dict(self._template_cache['member_bytes'])
+        }
+    
     def _modify_action_config(
         self, 
         template_data: Dict[str, Any], 
         colleague_name: str, 
-        km_macro_uuid: str,
-        temp_dir: str
-    ) -> Optional[Dict[str, Any]]:
+        km_macro_uuid: str
+    ) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
         """
         Modify the action configuration with colleague-specific data.
         
@@ -208,17 +266,18 @@ class StreamDeckClient:
             template_data: Extracted template data
             colleague_name: Name of the colleague
             km_macro_uuid: UUID of the Keyboard Maestro macro to link to
-            temp_dir: Temporary directory for processing
             
         Returns:
-            Modified template data, or None if failed
+            Tuple of modified template data and the action states whose image
+            must be replaced, or None if failed
         """
         try:
             self.logger.debug(f"Modifying action config for {colleague_name}")
             
             # Work with the first action profile (template should have one main profile)
             action_profile = template_data['action_profiles'][0]
-            manifest = action_profile['manifest'].copy()
+            manifest = action_profile['manifest']
+            image_states = []
             
             # Find and modify the first action
             for controller in manifest.get('Controllers', []):
@@ -244,32 +303,27 @@ class StreamDeckClient:
                         # Update the title
                         state['Title'] = colleague_name
                         
-                        # We'll update the image reference later
-                        # For now, just note that we need to replace it
-                        state['_needs_image_update'] = True
+                        # The image reference is updated once the icon exists
+                        image_states.append(state)
                 
                 self.logger.debug(f"Updated action config: KM UUID = {km_macro_uuid}")
                 break
             
-            # Update the modified manifest in the template data
-            action_profile['manifest'] = manifest
-            
-            return template_data
+            return template_data, image_states
             
         except Exception as e:
             self.logger.error(f"Failed to modify action config: {e}")
             return None
     
-    def _create_colleague_icon(self, colleague_name: str, temp_dir: str) -> Optional[str]:
+    def _create_colleague_icon(self, colleague_name: str) -> Optional[bytes]:
         """
         Create a Stream Deck format icon (288x288 PNG) from the colleague's profile photo.
         
         Args:
             colleague_name: Name of the colleague
-            temp_dir: Temporary directory for processing
             
         Returns:
-            Path to the created icon file, or None if failed
+            PNG data of the icon, or None if failed
         """
         try:
             self.logger.debug(f"Creating Stream Deck icon for {colleague_name}")
@@ -280,22 +334,27 @@ class StreamDeckClient:
                 self.logger.error(f"Profile photo not found: {source_photo}")
                 return None
             
+            # Pillow is only needed here, so keep it out of module import time
+            from PIL import Image
+            
             # Convert to Stream Deck format (288x288 PNG)
             with Image.open(source_photo) as img:
+                # Let JPEG sources decode at a reduced scale that is still at least 288x288
+                img.draft('RGB', (288, 288))
+                
                 # Convert to RGB if necessary (in case of RGBA or other formats)
-                if img.mode != 'RGB':
+                if img.mode not in ('RGB', 'L'):
                     img = img.convert('RGB')
                 
-                # Resize to 288x288 (Stream Deck button size)
-                img_resized = img.resize((288, 288), Image.LANCZOS)
+                # Resize to 288x288 (Stream Deck button size), box-reducing large sources first
+                img_resized = img.resize((288, 288), Image.LANCZOS, reducing_gap=2.0)
                 
-                # Save as PNG in temp directory
-                icon_filename = f"{colleague_name.replace(' ', '_').replace('/', '_')}.png"
-                icon_path = os.path.join(temp_dir, icon_filename)
-                img_resized.save(icon_path, 'PNG', optimize=True)
+                # Encode as PNG in memory; fast zlib level since the icon is local-only and imported once
+                buffer = io.BytesIO()
+                img_resized.save(buffer, 'PNG', compress_level=1, optimize=False)
                 
-                self.logger.debug(f"Created Stream Deck icon: {icon_path}")
-                return icon_path
+                self.logger.debug(f"Created Stream Deck icon for {colleague_name}")
+                return buffer.getvalue()
                 
         except Exception as e:
             self.logger.error(f"Failed to create colleague icon: {e}")
@@ -304,49 +363,34 @@ class StreamDeckClient:
     def _update_image_references(
         self, 
         template_data: Dict[str, Any], 
-        icon_path: str, 
-        temp_dir: str
+        image_states: List[Dict[str, Any]],
+        icon_bytes: bytes
     ) -> None:
         """
-        Update image references in the action configuration and copy icon to proper location.
+        Update image references in the action configuration and add the icon to the archive members.
         
         Args:
             template_data: Modified template data
-            icon_path: Path to the colleague's icon file
-            temp_dir: Temporary directory for processing
+            image_states: Action states to point at the new image
+            icon_bytes: PNG data of the colleague's icon
         """
         try:
             self.logger.debug("Updating image references")
             
             # Generate a new image UUID
-            new_image_uuid = str(uuid.uuid4()).replace('-', '').upper()
+            new_image_uuid = os.urandom(16).hex().upper()
             new_image_filename = f"{new_image_uuid}.png"
             
+            # Update action states to reference the new image
+            for state in image_states:
+                state['Image'] = f"Images/{new_image_filename}"
+            
             # Work with the action profile
             action_profile = template_data['action_profiles'][0]
-            manifest = action_profile['manifest']
             
-            # Update action states to reference the new image
-            for controller in manifest.get('Controllers', []):
-                actions = controller.get('Actions')
-                if not actions:
-                    continue
-                
-                for action_key, action in actions.items():
-                    if 'States' in action:
-                        for state in action['States']:
-                            if state.get('_needs_image_update'):
-                                # Update image reference
-                                state['Image'] = f"Images/{new_image_filename}"
-                                # Remove the temporary flag
-                                del state['_needs_image_update']
-            
-            # Copy the icon to the Images directory in the profile
-            images_dir = os.path.join(action_profile['path'], 'Images')
-            os.makedirs(images_dir, exist_ok=True)
-            
-            dest_icon_path = os.path.join(images_dir, new_image_filename)
-            shutil.copy2(icon_path, dest_icon_path)
+            # Add the icon to the Images directory in the profile
+            icon_arcname = f"{action_profile['arc_prefix']}/Images/{new_image_filename}"
+            template_data['member_bytes'][icon_arcname] = icon_bytes
             
             self.logger.debug(f"Updated image reference to: Images/{new_image_filename}")
             
@@ -356,8 +400,7 @@ class StreamDeckClient:
     def _create_action_file(
         self, 
         template_data: Dict[str, Any], 
-        colleague_name: str, 
-        temp_dir: str
+        colleague_name: str
     ) -> Optional[str]:
         """
         Create the final .streamDeckAction ZIP file.
@@ -365,7 +408,6 @@ class StreamDeckClient:
         Args:
             template_data: Modified template data
             colleague_name: Name of the colleague
-            temp_dir: Temporary directory for processing
             
         Returns:
             Path to the created .streamDeckAction file, or None if failed
@@ -373,28 +415,25 @@ class StreamDeckClient:
         try:
             self.logger.debug(f"Creating .streamDeckAction file for {colleague_name}")
             
-            # Save modified manifests back to the extracted directory
+            # Replace the template manifest with the modified one
             action_profile = template_data['action_profiles'][0]
-            manifest_path = os.path.join(action_profile['path'], 'manifest.json')
-            with open(manifest_path, 'w', encoding='utf-8') as f:
-                json.dump(action_profile['manifest'], f, separators=(',', ':'))
+            member_bytes = template_data['member_bytes']
+            member_bytes[f"{action_profile['arc_prefix']}/manifest.json"] = _dump_manifest(action_profile['manifest'])
             
             # Create the output .streamDeckAction file
-            safe_name = colleague_name.replace(' ', '_').replace('/', '_')
+            safe_name = sanitize_filename(colleague_name)
             colleague_folder = self.output_manager.get_colleague_folder(colleague_name)
             action_filename = f"One-to-One - {safe_name}.streamDeckAction"
             action_file_path = os.path.join(colleague_folder, action_filename)
             
             # Create ZIP archive with the proper structure
-            with zipfile.ZipFile(action_file_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # Add all files from the profile directory
-                profile_dir = template_data['profile_dir']
-                for root, dirs, files in os.walk(profile_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        # Calculate archive path relative to profile_dir parent
-                        arcname = os.path.relpath(file_path, os.path.dirname(profile_dir))
-                        zipf.write(file_path, arcname)
+            with zipfile.ZipFile(action_file_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+                # Add all profile files straight from memory; PNGs are already compressed
+                for arcname, data in member_bytes.items():
+                    if arcname.endswith('.png'):
+                        zipf.writestr(arcname, data, compress_type=zipfile.ZIP_STORED)
+                    else:
+                        zipf.writestr(arcname, data)
             
             self.logger.info(f"Created Stream Deck action file: {action_file_path}")
             return action_file_path
@@ -426,10 +465,30 @@ class StreamDeckClient:
         Returns:
             Path to the .streamDeckAction file
         """
-        safe_name = colleague_name.replace(' ', '_').replace('/', '_')
+        safe_name = sanitize_filename(colleague_name)
         colleague_folder = self.output_manager.get_colleague_folder(colleague_name)
         return os.path.join(colleague_folder, f"One-to-One - {safe_name}.streamDeckAction")
     
+    def get_import_applescript(self, colleague_name: str) -> Optional[Tuple[str, str]]:
+        """
+        Get AppleScript that imports the action and then opens Stream Deck.
+        
+        This lets the final import step be batched with other integrations in a
+        single osascript run; import_and_open_action does the same on its own.
+        
+        Args:
+            colleague_name: Full name of the colleague
+            
+        Returns:
+            Tuple of (import_script, open_script), or None if the action file doesn't exist
+        """
+        action_file = self.get_action_file_path(colleague_name)
+        if not os.path.exists(action_file):
+            self.logger.warning(f"Stream Deck action file not found: {action_file}")
+            return None
+        
+        return applescript_open_command(action_file), applescript_open_command('Stream Deck', app=True)
+    
     def import_and_open_action(self, colleague_name: str) -> bool:
         """
         Import the Stream Deck action and open Stream Deck app (final step).
@@ -7,6 +7,10 @@ This module provides common utility functions used across the project.
 import os
 
 
+# Characters replaced with '_' in generated file names
+_FILENAME_TRANSLATION = str.maketrans({' ': '_', '/': '_'})
+
+
 def get_file_size(file_path: str) -> int:
     """
     Get the size of a file in bytes.
@@ -21,3 +25,32 @@ def get_file_size(file_path: str) -> int:
         return os.path.getsize(file_path)
     except (OSError, FileNotFoundError):
         return 0
+
+
+def sanitize_filename(name: str) -> str:
+    """
+    Make a colleague name safe for use in a generated file name.
+    
+    Args:
+        name: Original name
+        
+    Returns:
+        Name with spaces and slashes replaced by underscores
+    """
+    return name.translate(_FILENAME_TRANSLATION)
+
+
+def applescript_open_command(target: str, app: bool = False) -> str:
+    """
+    Build an AppleScript line that runs `open` on a file, folder or URL.
+    
+    Args:
+        target: Path or URL to open, or an application name if app is set
+        app: If True, open the application with `open -a` (resolved only when run)
+        
+    Returns:
+        AppleScript source line
+    """
+    escaped = target.replace('\\', '\\\\').replace('"', '\\"')
+    command = "open -a " if app else "open "
+    return f'do shell script "{command}" & quoted form of "{escaped}"'
@@ -5,60 +5,185 @@ One-on-One Meeting Setup Automation
 This script automates the workflow for managing one-on-one meetings with colleagues.
 """
 
+import json
+import os
+import subprocess
 import sys
 import argparse
 import yaml
 import logging
-from pathlib import Path
-from typing import Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from lib.secrets import SecretsClient
-from lib.slack import SlackClient
-from lib.photo_manager import PhotoManager
-from lib.omnifocus import OmniFocusClient
 from lib.output_manager import OutputManager
-from lib.obsidian import ObsidianClient
-from lib.keyboard_maestro import KeyboardMaestroClient
-from lib.stream_deck import StreamDeckClient
+
+# Integration clients are imported on first use to keep start-up light
+if TYPE_CHECKING:
+    from lib.slack import SlackClient
+    from lib.photo_manager import PhotoManager
+    from lib.omnifocus import OmniFocusClient
+    from lib.obsidian import ObsidianClient
+    from lib.keyboard_maestro import KeyboardMaestroClient
+    from lib.stream_deck import StreamDeckClient
+
+# Seconds the apps get to pick up imported files before they are opened
+IMPORT_SETTLE_SECONDS = 2
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@lru_cache(maxsize=8)
+def _load_yaml(path: str, file_key: Tuple[int, int, int]) -> Dict[str, Any]:
+    """
+    Parse a YAML file, reusing the result while the file is unchanged.
+    
+    Across runs the parsed content is kept in a JSON file next to the YAML
+    file, which is used as long as the recorded file key matches. JSON is
+    used so that reading the cache can never execute code.
+    
+    Args:
+        path: Absolute path to the YAML file
+        file_key: Modification time, size and inode of the file, part of the cache key
+        
+    Returns:
+        Parsed YAML content (shared between callers, must not be modified)
+    """
+    cache_path = f"{path}.cache.json"
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.load(f)
+        if cached['key'] == list(file_key):
+            return cached['data']
+    except Exception:
+        pass
+    
+    # Read bytes and let libyaml handle the UTF-8 decoding
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    
+    try:
+        # Only cache content JSON reproduces exactly (no dates, non-string keys, ...)
+        encoded = json.dumps({'key': list(file_key), 'data': data})
+        if json.loads(encoded)['data'] == data:
+            tmp_path = f"{cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(encoded)
+            os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError):
+        pass
+    
+    return data
 
 
 class OneOnOneSetup:
     """Main class for handling one-on-one meeting setup automation."""
     
-    def __init__(self, config_path: str = "config.yaml"):
-        """Initialize the setup with configuration."""
+    def __init__(self, config_path: str = "config.yaml", dry_run: bool = False):
+        """
+        Initialize the setup with configuration.
+        
+        Args:
+            config_path: Path to the YAML configuration file
+            dry_run: If True, setups default to simulating operations, so no Slack
+                client is created and OmniFocus is never queried
+        """
         self.config_path = config_path
+        self.dry_run = dry_run
         self.config = self._load_config()
         self._setup_logging()
         
-        # Initialize service clients
+        # Initialize core services; integration clients are created on first use
         self.secrets_client = SecretsClient()
         self.output_manager = OutputManager(self.config)
-        self.photo_manager = PhotoManager(self.config, self.output_manager)
-        self.omnifocus_client = OmniFocusClient(self.config, self.output_manager)
-        self.obsidian_client = self._initialize_obsidian_client()
-        self.keyboard_maestro_client = self._initialize_keyboard_maestro_client()
-        self.stream_deck_client = self._initialize_stream_deck_client()
+        
+        # Slack client being created in the background (see warmup)
+        self._slack_client_future: Optional[Future] = None
+        if not dry_run:
+            self.warmup()
+    
+    def warmup(self) -> None:
+        """
+        Start creating the Slack client in the background.
+        
+        Resolving the token and making the first API call then overlap with the
+        rest of start-up instead of delaying the first setup step.
+        """
+        if self._slack_client_future is None:
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._slack_client_future = executor.submit(self._create_slack_client)
+            executor.shutdown(wait=False)
+    
+    def _create_slack_client(self) -> 'SlackClient':
+        """Create the authenticated Slack client and warm up its connection."""
+        from lib.slack import SlackClient
+        slack_client = SlackClient.create_from_config(self.config, self.secrets_client)
+        slack_client.warm_up()
+        return slack_client
+    
+    def _get_slack_client(self) -> 'SlackClient':
+        """Get the Slack client started by warmup(), starting it now if needed."""
+        self.warmup()
+        try:
+            return self._slack_client_future.result()
+        except Exception:
+            # Let the next setup retry instead of re-raising the same error
+            self._slack_client_future = None
+            raise
+    
+    @cached_property
+    def photo_manager(self) -> 'PhotoManager':
+        """Photo manager, created on first use."""
+        from lib.photo_manager import PhotoManager
+        return PhotoManager(self.config, self.output_manager)
+    
+    @cached_property
+    def omnifocus_client(self) -> 'OmniFocusClient':
+        """OmniFocus client, created on first use."""
+        from lib.omnifocus import OmniFocusClient
+        return OmniFocusClient(self.config, self.output_manager)
+    
+    @cached_property
+    def obsidian_client(self) -> Optional['ObsidianClient']:
+        """Obsidian client (None if disabled), created on first use."""
+        return self._initialize_obsidian_client()
+    
+    @cached_property
+    def keyboard_maestro_client(self) -> Optional['KeyboardMaestroClient']:
+        """Keyboard Maestro client (None if disabled), created on first use."""
+        return self._initialize_keyboard_maestro_client()
+    
+    @cached_property
+    def stream_deck_client(self) -> Optional['StreamDeckClient']:
+        """Stream Deck client (None if disabled), created on first use."""
+        return self._initialize_stream_deck_client()
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file."""
-        config_file = Path(self.config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+        config_file = os.path.abspath(self.config_path)
+        try:
+            stat = os.stat(config_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}") from None
         
         try:
-            with open(config_file, 'r') as f:
-                return yaml.safe_load(f)
+            return _load_yaml(config_file, (stat.st_mtime_ns, stat.st_size, stat.st_ino))
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML configuration: {e}")
     
     def _setup_logging(self):
         """Configure logging based on config settings."""
-        log_level = self.config.get('logging', {}).get('level', 'INFO')
-        logging.basicConfig(
-            level=getattr(logging, log_level.upper()),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+        # Only the first setup in a process configures logging
+        if not logging.root.handlers:
+            log_level = self.config.get('logging', {}).get('level', 'INFO')
+            logging.basicConfig(
+                level=getattr(logging, log_level.upper()),
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
         self.logger = logging.getLogger(__name__)
     
     def _initialize_obsidian_client(self) -> Optional['ObsidianClient']:
@@ -68,6 +193,7 @@ class OneOnOneSetup:
                 self.logger.info("Obsidian integration disabled (no vault_path configured)")
                 return None
             
+            from lib.obsidian import ObsidianClient
             return ObsidianClient(self.config, self.output_manager)
         except Exception as e:
             self.logger.warning(f"Obsidian integration disabled due to configuration error: {e}")
@@ -80,6 +206,7 @@ class OneOnOneSetup:
                 self.logger.info("Keyboard Maestro integration disabled (no configuration)")
                 return None
             
+            from lib.keyboard_maestro import KeyboardMaestroClient
             return KeyboardMaestroClient(self.config, self.output_manager)
         except Exception as e:
             self.logger.warning(f"Keyboard Maestro integration disabled due to configuration error: {e}")
@@ -90,13 +217,15 @@ class OneOnOneSetup:
         try:
             # Stream Deck client uses fixed template and grid position for standardization
             # No configuration required - works out of the box
+            from lib.stream_deck import StreamDeckClient
             return StreamDeckClient(self.config, self.output_manager)
         except Exception as e:
             self.logger.warning(f"Stream Deck integration disabled due to template file error: {e}")
             return None
     
     
-    def _download_colleague_photo(self, slack_client: SlackClient, name: str, slack_handle: str) -> bool:
+    def _download_colleague_photo(self, slack_client: 'SlackClient', name: str, slack_handle: str,
+                                  refresh_photo: bool = False) -> bool:
         """
         Download colleague's profile photo from Slack.
         
@@ -104,11 +233,12 @@ class OneOnOneSetup:
             slack_client: Initialized Slack client
             name: Colleague's full name
             slack_handle: Slack username (without @)
+            refresh_photo: If True, download even if a photo already exists
             
         Returns:
             True if photo was downloaded successfully, False otherwise
         """
-        success = self.photo_manager.download_from_slack(slack_client, name, slack_handle)
+        success = self.photo_manager.download_from_slack(slack_client, name, slack_handle, force=refresh_photo)
         
         # Open the colleague folder in Finder right after it's created
         if success:
@@ -206,115 +336,276 @@ class OneOnOneSetup:
             name: Colleague's full name
         """
         try:
-            import subprocess
             colleague_folder = self.output_manager.get_colleague_folder(name)
-            subprocess.run(['open', colleague_folder], timeout=5)
+            # Fire and forget: nothing depends on Finder actually showing the folder
+            subprocess.Popen(
+                ['open', colleague_folder],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
             self.logger.info(f"📂 Opened colleague folder in Finder: {name}")
         except Exception as e:
             self.logger.debug(f"Could not open folder automatically: {e}")
     
     
-    def setup_colleague(self, name: str, slack_handle: str, dry_run: bool = False):
+    def _finalize_imports(self, name: str, importers: List[Tuple[str, Callable, Callable]]) -> None:
         """
-        Main method to set up everything for a new colleague.
+        Import and open the colleague's items with a single osascript run.
+        
+        All imports are started first, followed by one pause for the apps to pick
+        them up, and then everything that was imported is opened. Each line runs
+        in its own try block and the script returns the lines that failed, so a
+        failure never stops the others and only items whose import failed fall
+        back to their client's own import-and-open method. The whole batch only
+        falls back when the script never ran.
         
         Args:
             name: Colleague's full name
-            slack_handle: Colleague's Slack username
-            dry_run: If True, simulate operations without making changes
+            importers: (label, get_import_applescript, import_and_open) of the clients to import into
         """
-        self.logger.info(f"Starting setup for colleague: {name} (@{slack_handle})")
+        batch = []
+        for label, get_script, import_and_open in importers:
+            scripts = get_script(name)
+            if scripts:
+                batch.append((label, scripts, import_and_open))
+        
+        if not batch:
+            return
+        
+        lines = ['set failures to ""']
+        for index, (_, (import_script, _), _) in enumerate(batch):
+            lines.append(f"set imported{index} to false")
+            lines.extend(self._applescript_step(import_script, 'import', index,
+                                                on_success=f"set imported{index} to true"))
+        lines.append(f"delay {IMPORT_SETTLE_SECONDS}")
+        for index, (_, (_, open_script), _) in enumerate(batch):
+            lines.append(f"if imported{index} then")
+            lines.extend(self._applescript_step(open_script, 'open', index))
+            lines.append("end if")
+        lines.append("return failures")
         
+        self.logger.info("")
+        self.logger.info("🚀 FINAL STEP: Importing and opening everything that was created...")
+        args = ['osascript']
+        for line in lines:
+            args.extend(['-e', line])
         try:
-            # Step 1: Create authenticated Slack client
-            slack_client = SlackClient.create_from_config(self.config, self.secrets_client, dry_run)
-            
-            # Step 2: Download Slack profile photo
-            if dry_run:
-                self.logger.info(f"[DRY-RUN] Would download profile photo for {name} (@{slack_handle})")
-                photo_success = True
+            result = subprocess.run(args, capture_output=True, text=True, timeout=30)
+        except OSError as e:
+            self.logger.warning(f"⚠️  Batched import failed: {e}")
+            self._import_one_by_one(name, batch)
+            return
+        except subprocess.TimeoutExpired:
+            # Some items may already be imported; retrying could import them twice
+            self.logger.warning("⚠️  Timeout while importing - check the apps and import anything missing manually")
+            return
+        
+        if result.returncode != 0:
+            reason = result.stderr.strip() or f"exit status {result.returncode}"
+            self.logger.warning(f"⚠️  Batched import failed: {reason}")
+            # Runtime errors are caught per line, so anything else means the script didn't run
+            if 'execution error' in result.stderr:
+                self.logger.warning("⚠️  Check the apps and import anything missing manually")
             else:
-                photo_success = self._download_colleague_photo(slack_client, name, slack_handle)
-                if not photo_success:
-                    self.logger.warning("Failed to download profile photo, continuing anyway...")
-            
-            # Step 3: Create OmniFocus tag
-            if dry_run:
-                tag_info = self.omnifocus_client.get_tag_info(name)
-                self.logger.info(f"[DRY-RUN] Would create OmniFocus tag: {tag_info['tag_name']}")
-                omnifocus_tag_success = True
+                self._import_one_by_one(name, batch)
+            return
+        
+        failed_imports = set()
+        for failure in result.stdout.splitlines():
+            parts = failure.split('\t', 2)
+            if len(parts) != 3 or parts[0] not in ('import', 'open') or not parts[1].isdigit():
+                continue
+            step, index, message = parts[0], int(parts[1]), parts[2]
+            label = batch[index][0]
+            if step == 'import':
+                failed_imports.add(index)
+                self.logger.warning(f"⚠️  Failed to import {label}: {message}")
             else:
-                omnifocus_tag_success = self._create_omnifocus_tag(name, slack_handle)
-                if not omnifocus_tag_success:
-                    self.logger.warning("Failed to create OmniFocus tag, continuing anyway...")
+                self.logger.warning(f"⚠️  Imported {label} but could not open it: {message}")
+        
+        if failed_imports:
+            self._import_one_by_one(name, [batch[index] for index in sorted(failed_imports)])
+        elif not result.stdout.strip():
+            self.logger.info("✅ Imported and opened successfully!")
+    
+    @staticmethod
+    def _applescript_step(script: str, step: str, index: int, on_success: Optional[str] = None) -> List[str]:
+        """
+        Wrap an AppleScript line so a failure is recorded instead of stopping the script.
+        
+        Args:
+            script: AppleScript line to run
+            step: Step name recorded on failure ('import' or 'open')
+            index: Index of the item in the batch
+            on_success: Optional line to run after the script succeeded
             
-            # Step 4: Create OmniFocus perspective
-            if dry_run:
-                self.logger.info(f"[DRY-RUN] Would create OmniFocus perspective: {name}")
-                omnifocus_perspective_success = True
-            else:
-                omnifocus_perspective_success = self._create_omnifocus_perspective(name)
-                if not omnifocus_perspective_success:
-                    self.logger.warning("Failed to create OmniFocus perspective, continuing anyway...")
+        Returns:
+            AppleScript source lines
+        """
+        lines = ["try", script]
+        if on_success:
+            lines.append(on_success)
+        lines.extend([
+            "on error errMsg",
+            f'set failures to failures & "{step}" & tab & "{index}" & tab & errMsg & linefeed',
+            "end try",
+        ])
+        return lines
+    
+    def _import_one_by_one(self, name: str, batch: List[Tuple[str, Tuple[str, str], Callable]]) -> None:
+        """
+        Import and open items with each client's own method.
+        
+        Args:
+            name: Colleague's full name
+            batch: (label, scripts, import_and_open) entries to import
+        """
+        for _, _, import_and_open in batch:
+            import_and_open(name)
+    
+    def _log_step(self, step: str, *args: Any, dry_run: bool = False, success: bool = True) -> None:
+        """
+        Log the outcome of a setup step as a single lazily formatted record.
+        
+        Args:
+            step: What the step does, as a %-style format string (e.g. "create Obsidian note: %s")
+            *args: Arguments for the format string
+            dry_run: If True, log that the step would be performed
+            success: Whether the step succeeded; failures are logged as warnings
+        """
+        if dry_run:
+            self.logger.info("[DRY-RUN] Would " + step, *args)
+        elif not success:
+            self.logger.warning("Failed to " + step + ", continuing anyway...", *args)
+    
+    def _create_colleague_items(self, slack_client: 'SlackClient', name: str, slack_handle: str,
+                                refresh_photo: bool) -> Dict[str, bool]:
+        """
+        Run setup steps 2-7, overlapping the steps that don't depend on each other.
+        
+        The photo download and the OmniFocus tag run first. The perspective, the
+        Obsidian note and the Keyboard Maestro macro all use the photo (and the
+        perspective uses the tag), so they run concurrently once both are done.
+        The Stream Deck action follows the macro it links to.
+        
+        Args:
+            slack_client: Initialized Slack client
+            name: Colleague's full name
+            slack_handle: Colleague's Slack username
+            refresh_photo: If True, re-download the profile photo even if one exists
             
-            # Step 5: Create Obsidian note
-            if dry_run:
-                self.logger.info(f"[DRY-RUN] Would create Obsidian note: {name}")
-                obsidian_success = True
-            else:
-                obsidian_success = self._create_obsidian_note(name, slack_handle)
-                if not obsidian_success:
-                    self.logger.warning("Failed to create Obsidian note, continuing anyway...")
+        Returns:
+            Dictionary mapping each step to its success
+        """
+        results = {}
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            # Step 2: Download Slack profile photo / Step 3: Create OmniFocus tag
+            photo_future = executor.submit(self._download_colleague_photo, slack_client, name, slack_handle,
+                                           refresh_photo)
+            tag_future = executor.submit(self._create_omnifocus_tag, name, slack_handle)
+            
+            results['photo'] = photo_future.result()
+            self._log_step("download profile photo", success=results['photo'])
+            
+            results['omnifocus_tag'] = tag_future.result()
+            self._log_step("create OmniFocus tag", success=results['omnifocus_tag'])
+            
+            # Step 4: Create OmniFocus perspective / Step 5: Create Obsidian note
+            perspective_future = executor.submit(self._create_omnifocus_perspective, name)
+            obsidian_future = executor.submit(self._create_obsidian_note, name, slack_handle)
             
             # Step 6: Create Keyboard Maestro macro
+            results['keyboard_maestro'], km_macro_uuid = self._create_keyboard_maestro_macro(name, slack_handle)
+            self._log_step("create Keyboard Maestro macro", success=results['keyboard_maestro'])
+            if not results['keyboard_maestro']:
+                km_macro_uuid = None
+            
+            # Step 7: Create Stream Deck action
+            results['stream_deck'] = self._create_stream_deck_action(name, km_macro_uuid)
+            self._log_step("create Stream Deck action", success=results['stream_deck'])
+            
+            results['omnifocus_perspective'] = perspective_future.result()
+            self._log_step("create OmniFocus perspective", success=results['omnifocus_perspective'])
+            
+            results['obsidian'] = obsidian_future.result()
+            self._log_step("create Obsidian note", success=results['obsidian'])
+        
+        return results
+    
+    def setup_colleague(self, name: str, slack_handle: str, dry_run: Optional[bool] = None,
+                        refresh_photo: bool = False):
+        """
+        Main method to set up everything for a new colleague.
+        
+        Args:
+            name: Colleague's full name
+            slack_handle: Colleague's Slack username
+            dry_run: If True, simulate operations without making changes
+                (defaults to the dry_run given at construction)
+            refresh_photo: If True, re-download the profile photo even if one exists
+        """
+        if dry_run is None:
+            dry_run = self.dry_run
+        
+        self.logger.info(f"Starting setup for colleague: {name} (@{slack_handle})")
+        
+        try:
+            # Step 1: Create authenticated Slack client (not needed when simulating)
             if dry_run:
-                self.logger.info(f"[DRY-RUN] Would create Keyboard Maestro macro: One-to-One - {name}")
-                keyboard_maestro_success = True
-                km_macro_uuid = "DRY-RUN-UUID-123"
+                slack_client = None
             else:
-                keyboard_maestro_success, km_macro_uuid = self._create_keyboard_maestro_macro(name, slack_handle)
-                if not keyboard_maestro_success:
-                    self.logger.warning("Failed to create Keyboard Maestro macro, continuing anyway...")
-                    km_macro_uuid = None
+                slack_client = self._get_slack_client()
             
-            # Step 7: Create Stream Deck action
+            # Steps 2-7: Create the colleague's photo, tags, notes, macros and actions
             if dry_run:
-                self.logger.info(f"[DRY-RUN] Would create Stream Deck action: One-to-One - {name}")
+                self._log_step("download profile photo for %s (@%s)", name, slack_handle, dry_run=True)
+                tag_name = self.omnifocus_client.get_tag_name(name)
+                self._log_step("create OmniFocus tag: %s", tag_name, dry_run=True)
+                self._log_step("create OmniFocus perspective: %s", name, dry_run=True)
+                self._log_step("create Obsidian note: %s", name, dry_run=True)
+                self._log_step("create Keyboard Maestro macro: One-to-One - %s", name, dry_run=True)
+                self._log_step("create Stream Deck action: One-to-One - %s", name, dry_run=True)
+                omnifocus_perspective_success = True
+                keyboard_maestro_success = True
                 stream_deck_success = True
             else:
-                stream_deck_success = self._create_stream_deck_action(name, km_macro_uuid)
-                if not stream_deck_success:
-                    self.logger.warning("Failed to create Stream Deck action, continuing anyway...")
+                results = self._create_colleague_items(slack_client, name, slack_handle, refresh_photo)
+                omnifocus_perspective_success = results['omnifocus_perspective']
+                keyboard_maestro_success = results['keyboard_maestro']
+                stream_deck_success = results['stream_deck']
             
-            # Step 8: Import and open OmniFocus perspective (final step)
+            # Steps 8-10: Import and open the perspective, macro and action (final step)
             if dry_run:
-                self.logger.info(f"[DRY-RUN] Would import and open OmniFocus perspective: {name}")
+                self._log_step("import and open OmniFocus perspective: %s", name, dry_run=True)
+                self._log_step("import and open Keyboard Maestro macro: One-to-One - %s", name, dry_run=True)
+                self._log_step("import and open Stream Deck action: One-to-One - %s", name, dry_run=True)
             else:
-                # Only import and open if we successfully created the perspective
+                # Only import and open what was created successfully
+                importers = []
                 if omnifocus_perspective_success:
-                    self.omnifocus_client.import_and_open_perspective(name)
+                    importers.append(("OmniFocus perspective",
+                                      self.omnifocus_client.get_import_applescript,
+                                      self.omnifocus_client.import_and_open_perspective))
                 else:
                     self.logger.info("Skipping perspective import - perspective was not created successfully")
-            
-            # Step 9: Import and open Keyboard Maestro macro (final step)
-            if dry_run:
-                self.logger.info(f"[DRY-RUN] Would import and open Keyboard Maestro macro: One-to-One - {name}")
-            else:
-                # Only import and open if we successfully created the macro
+                
                 if keyboard_maestro_success and self.keyboard_maestro_client:
-                    self.keyboard_maestro_client.import_and_open_macro(name)
+                    importers.append(("Keyboard Maestro macro",
+                                      self.keyboard_maestro_client.get_import_applescript,
+                                      self.keyboard_maestro_client.import_and_open_macro))
                 else:
                     self.logger.info("Skipping macro import - macro was not created successfully")
-            
-            # Step 10: Import and open Stream Deck action (final step)
-            if dry_run:
-                self.logger.info(f"[DRY-RUN] Would import and open Stream Deck action: One-to-One - {name}")
-            else:
-                # Only import and open if we successfully created the action
+                
                 if stream_deck_success and self.stream_deck_client:
-                    self.stream_deck_client.import_and_open_action(name)
+                    importers.append(("Stream Deck action",
+                                      self.stream_deck_client.get_import_applescript,
+                                      self.stream_deck_client.import_and_open_action))
                 else:
                     self.logger.info("Skipping Stream Deck import - action was not created successfully")
+                
+                self._finalize_imports(name, importers)
             
             self.logger.info("Setup completed successfully!")
             
@@ -323,8 +614,8 @@ class OneOnOneSetup:
             raise
 
 
-def main():
-    """Main entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(
         description="Set up one-on-one meeting automation for a colleague"
     )
@@ -340,12 +631,24 @@ def main():
         action="store_true",
         help="Simulate operations without making changes"
     )
-    
-    args = parser.parse_args()
+    parser.add_argument(
+        "--refresh-photo",
+        action="store_true",
+        help="Re-download the profile photo even if one already exists"
+    )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def main():
+    """Main entry point."""
+    args = _PARSER.parse_args()
     
     try:
-        setup = OneOnOneSetup(args.config)
-        setup.setup_colleague(args.name, args.slack_handle, dry_run=args.dry_run)
+        setup = OneOnOneSetup(args.config, dry_run=args.dry_run)
+        setup.setup_colleague(args.name, args.slack_handle, dry_run=args.dry_run, refresh_photo=args.refresh_photo)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)